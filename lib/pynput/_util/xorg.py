@@ -24,6 +24,7 @@ import contextlib
 import functools
 import itertools
 import operator
+import time
 
 import Xlib.display
 import Xlib.keysymdef
@@ -382,6 +383,18 @@ class ListenerMixin:
     #: The events for which to listen
     _EVENTS = tuple()
 
+    #: The event types for which only the last of a run of consecutive events
+    #: received at once is passed to :meth:`_handle`, if :attr:`_coalesce` is
+    #: set
+    _COALESCED_EVENTS = tuple()
+
+    #: Whether to coalesce runs of the events in :attr:`_COALESCED_EVENTS`
+    _coalesce = False
+
+    #: The number of events handled from a single block before yielding to
+    #: other threads, or ``None`` to never yield
+    _MAX_EVENTS_PER_BATCH = None
+
     #: We use this instance for parsing the binary data
     _EVENT_PARSER = Xlib.protocol.rq.EventField(None)
 
@@ -471,11 +484,34 @@ class ListenerMixin:
 
         data = events.data
 
+        # Look up everything used for every event only once per block
+        parse = self._EVENT_PARSER.parse_binary_value
+        handle = self._handle
+        record_display = self._display_record.display
+        stop_display = self._display_stop
+        coalesced = self._COALESCED_EVENTS if self._coalesce else ()
+        max_events = self._MAX_EVENTS_PER_BATCH
+
+        # We keep the last event until we know whether the next one replaces
+        # it
+        previous = None
+        handled = 0
         while data and len(data):
-            event, data = self._EVENT_PARSER.parse_binary_value(
-                data, self._display_record.display, None, None
-            )
-            self._handle(self._display_stop, event)
+            event, data = parse(data, record_display, None, None)
+            if previous is not None and not (
+                previous.type == event.type and event.type in coalesced
+            ):
+                handle(stop_display, previous)
+
+                # Let other threads run during long bursts of events
+                handled += 1
+                if handled == max_events:
+                    handled = 0
+                    time.sleep(0)
+            previous = event
+
+        if previous is not None:
+            handle(stop_display, previous)
 
     def _initialize(self, display):
         """Initialises this listener.
@@ -22,7 +22,7 @@ See the documentation for more information.
 
 # KeyCode, Key, Controller and Listener are not constants
 
-import itertools
+import functools
 import platform
 from typing import TYPE_CHECKING, Type, Union
 
@@ -56,16 +56,65 @@ _MODIFIER_KEYS = (
 )
 
 #: Normalised modifiers as a mapping from virtual key code to basic modifier.
-_NORMAL_MODIFIERS = {
-    value: key
-    for combination in _MODIFIER_KEYS
-    for key, value in zip(itertools.cycle((combination[0],)), combination[1])
-}
+_NORMAL_MODIFIERS = {value: key for key, values in _MODIFIER_KEYS for value in values}
+
+#: The basic modifiers.
+_MODIFIER_KEY_SET = frozenset(_NORMAL_MODIFIERS.values())
 
 #: Control codes to transform into key codes when typing
 _CONTROL_CODES = {"\n": Key.enter, "\r": Key.enter, "\t": Key.tab}
 
 
+@functools.lru_cache(maxsize=512)
+def _key_factory(s):
+    """Returns a factory for the key described by a key identifier.
+
+    The result is cached, since the same identifiers, such as ``'<ctrl>'``,
+    are commonly shared by many hotkeys. Key codes are mutable, so the
+    factory creates a new key code for every call; for modifiers, it returns
+    the :class:`Key` member.
+
+    :param str s: The key identifier.
+
+    :return: a callable taking no arguments and returning the key
+
+    :raises ValueError: if the key identifier is invalid
+    """
+    if len(s) == 1:
+        return functools.partial(KeyCode.from_char, s.lower())
+    elif len(s) > 2 and (s[0], s[-1]) == ("<", ">"):
+        p = s[1:-1]
+        try:
+            # We want to represent modifiers as Key instances, and all other
+            # keys as KeyCodes
+            key = Key[p.lower()]
+            if key in _MODIFIER_KEY_SET:
+                return lambda: key
+            else:
+                assert key.value is not None, "Key has no value"
+                assert key.value.vk is not None, "KeyCode has no vk"
+                return functools.partial(KeyCode.from_vk, key.value.vk)
+        except KeyError:
+            try:
+                return functools.partial(KeyCode.from_vk, int(p))
+            except ValueError:
+                raise ValueError(s)
+    else:
+        raise ValueError(s)
+
+
+def _parse_token(s):
+    """Parses a single key identifier of a key combination string.
+
+    :param str s: The key identifier.
+
+    :return: a key
+
+    :raises ValueError: if the key identifier is invalid
+    """
+    return _key_factory(s)()
+
+
 class Events(_Events):
     """A keyboard event listener supporting synchronous iteration over the
     events.
@@ -130,10 +179,15 @@ class HotKey:
     """
 
     def __init__(self, keys, on_activate):
-        self._state = set()
-        self._keys = set(keys)
+        self._keys = frozenset(keys)
         self._on_activate = on_activate
 
+        # The state is a bit mask of the currently pressed keys, with one bit
+        # assigned to every key in the combination
+        self._bits = {key: 1 << i for i, key in enumerate(self._keys)}
+        self._mask = (1 << len(self._bits)) - 1
+        self._state = 0
+
     @staticmethod
     def parse(keys):
         """Parses a key combination string.
@@ -150,48 +204,32 @@ class HotKey:
         """
 
         def parts():
-            start = 0
-            for i, c in enumerate(keys):
-                if c == "+" and i != start:
-                    yield keys[start:i]
-                    start = i + 1
-            if start == len(keys):
-                raise ValueError(keys)
-            else:
-                yield keys[start:]
-
-        def parse(s):
-            if len(s) == 1:
-                return KeyCode.from_char(s.lower())
-            elif len(s) > 2 and (s[0], s[-1]) == ("<", ">"):
-                p = s[1:-1]
-                try:
-                    # We want to represent modifiers as Key instances, and all
-                    # other keys as KeyCodes
-                    key = Key[p.lower()]
-                    if key in _NORMAL_MODIFIERS.values():
-                        return key
-                    else:
-                        assert key.value is not None, "Key has no value"
-                        assert key.value.vk is not None, "KeyCode has no vk"
-                        return KeyCode.from_vk(key.value.vk)
-                except KeyError:
+            # An empty token means that the part starts with "+", which is
+            # how the "+" key itself is written; join it with the next token
+            tokens = iter(keys.split("+"))
+            for token in tokens:
+                if token:
+                    yield token
+                else:
                     try:
-                        return KeyCode.from_vk(int(p))
-                    except ValueError:
-                        raise ValueError(s)
-            else:
-                raise ValueError(s)
+                        yield "+" + next(tokens)
+                    except StopIteration:
+                        raise ValueError(keys)
 
         # Split the string and parse the individual parts
         raw_parts = list(parts())
-        parsed_parts = [parse(s) for s in raw_parts]
+        parsed_parts = []
+        seen = set()
+        for s in raw_parts:
+            parsed = _parse_token(s)
 
-        # Ensure no duplicate parts
-        if len(parsed_parts) != len(set(parsed_parts)):
-            raise ValueError(keys)
-        else:
-            return parsed_parts
+            # Ensure no duplicate parts
+            if parsed in seen:
+                raise ValueError(keys)
+            seen.add(parsed)
+            parsed_parts.append(parsed)
+
+        return parsed_parts
 
     def press(self, key):
         """Updates the hotkey state for a pressed key.
@@ -204,9 +242,10 @@ class HotKey:
         :param key: The key being pressed.
         :type key: Key or KeyCode
         """
-        if key in self._keys and key not in self._state:
-            self._state.add(key)
-            if self._state == self._keys:
+        bit = self._bits.get(key, 0)
+        if bit and not self._state & bit:
+            self._state |= bit
+            if self._state == self._mask:
                 self._on_activate()
 
     def release(self, key):
@@ -215,8 +254,7 @@ class HotKey:
         :param key: The key being released.
         :type key: Key or KeyCode
         """
-        if key in self._state:
-            self._state.remove(key)
+        self._state &= ~self._bits.get(key, 0)
 
 
 class GlobalHotKeys(Listener):  # type: ignore
@@ -235,6 +273,13 @@ class GlobalHotKeys(Listener):  # type: ignore
         self._hotkeys = [
             HotKey(HotKey.parse(key), value) for key, value in hotkeys.items()
         ]
+
+        # Index the hotkeys by their keys, so that an event only visits the
+        # hotkeys it may affect
+        self._hotkeys_by_key = {}
+        for hotkey in self._hotkeys:
+            for key in hotkey._keys:
+                self._hotkeys_by_key.setdefault(key, []).append(hotkey)
         super(GlobalHotKeys, self).__init__(
             on_press=self._on_press, on_release=self._on_release, *args, **kwargs
         )
@@ -246,8 +291,9 @@ class GlobalHotKeys(Listener):  # type: ignore
 
         :param key: The key provided by the base class.
         """
-        for hotkey in self._hotkeys:
-            hotkey.press(self.canonical(key))
+        canonical = self.canonical(key)
+        for hotkey in self._hotkeys_by_key.get(canonical, ()):
+            hotkey.press(canonical)
 
     def _on_release(self, key):
         """The release callback.
@@ -256,5 +302,6 @@ class GlobalHotKeys(Listener):  # type: ignore
 
         :param key: The key provided by the base class.
         """
-        for hotkey in self._hotkeys:
-            hotkey.release(self.canonical(key))
+        canonical = self.canonical(key)
+        for hotkey in self._hotkeys_by_key.get(canonical, ()):
+            hotkey.release(canonical)
@@ -25,16 +25,32 @@ implementation is located in a platform dependent module.
 
 import contextlib
 import enum
+import functools
 import threading
 import unicodedata
 from typing import Any, Callable, Dict, Optional, Union
 
-import six
-
 from .. import _logger
 from .._util import AbstractListener, prefix
 
 
+@functools.lru_cache(maxsize=None)
+def _combining(char):
+    """Returns the combining version of a stand alone character.
+
+    The result is cached, since the set of dead keys is small and key codes
+    for them are created repeatedly.
+
+    :param str char: The stand alone character, such as ``'~'``.
+
+    :return: the combining character, or ``None`` if none exists
+    """
+    try:
+        return unicodedata.lookup("COMBINING " + unicodedata.name(char))
+    except KeyError:
+        return None
+
+
 class KeyCode:
     """
     A :class:`KeyCode` represents the description of a key code used by the
@@ -55,19 +71,15 @@ class KeyCode:
             raise ValueError("Either vk or char must be set")
 
         self.vk = vk
-        self.char = six.text_type(char) if char is not None else None
+        self.char = str(char) if char is not None else None
         self.is_dead = is_dead
 
         if self.is_dead:
             if self.char is None:
                 raise ValueError("Dead keys must have a character")
-            try:
-                self.combining = unicodedata.lookup(
-                    "COMBINING " + unicodedata.name(self.char)
-                )
-            except KeyError:
+            self.combining = _combining(self.char)
+            if self.combining is None:
                 self.is_dead = False
-                self.combining = None
             if self.is_dead and not self.combining:
                 raise KeyError(char)
         else:
@@ -356,7 +368,14 @@ class Controller:
         pass
 
     def __init__(self):
+        from . import _NORMAL_MODIFIERS
+
         self._log = _logger(self.__class__)
+        self._modifier_map = _NORMAL_MODIFIERS
+        self._caps_lock_value = self._Key.caps_lock.value
+        # This lock must be reentrant: the modifiers context manager holds it
+        # for the duration of a user block, and pressing a key from within
+        # such a block reads the shift state
         self._modifiers_lock = threading.RLock()
         self._modifiers = set()
         self._caps_lock = False
@@ -384,7 +403,7 @@ class Controller:
         self._update_modifiers(resolved, True)
 
         # Update caps lock state
-        if resolved == self._Key.caps_lock.value:
+        if resolved == self._caps_lock_value:
             self._caps_lock = not self._caps_lock
 
         # If we currently have a dead key pressed, join it with this key
@@ -499,11 +518,33 @@ class Controller:
         """
         from . import _CONTROL_CODES
 
+        # Characters and key constants resolve independently of the
+        # controller state, so each distinct one is resolved only once
+        resolved_keys = {}
+
         for i, character in enumerate(string):
             key = _CONTROL_CODES.get(character, character)
             try:
-                self.press(key)
-                self.release(key)
+                resolved = resolved_keys.get(key)
+                if resolved is None:
+                    resolved = self._resolve(key)
+                    if resolved is None:
+                        raise self.InvalidKeyException(key)
+                    resolved_keys[key] = resolved
+
+                # Characters are never modifiers, so unless a dead key is
+                # involved they can be emitted without the state handling
+                # of press and release
+                if (
+                    resolved.char is not None
+                    and not resolved.is_dead
+                    and self._dead_key is None
+                ):
+                    self._handle(resolved, True)
+                    self._handle(resolved, False)
+                else:
+                    self.press(key)
+                    self.release(key)
 
             except (ValueError, self.InvalidKeyException):
                 raise self.InvalidCharacterException(i, character)
@@ -539,8 +580,7 @@ class Controller:
         Please note that this reflects only the internal state of this
         controller. See :attr:`modifiers` for more information.
         """
-        with self.modifiers as modifiers:
-            return self._Key.alt in modifiers
+        return self._modifier_contains(self._Key.alt)
 
     @property
     def alt_gr_pressed(self):
@@ -549,8 +589,7 @@ class Controller:
         Please note that this reflects only the internal state of this
         controller. See :attr:`modifiers` for more information.
         """
-        with self.modifiers as modifiers:
-            return self._Key.alt_gr in modifiers
+        return self._modifier_contains(self._Key.alt_gr)
 
     @property
     def ctrl_pressed(self):
@@ -559,8 +598,7 @@ class Controller:
         Please note that this reflects only the internal state of this
         controller. See :attr:`modifiers` for more information.
         """
-        with self.modifiers as modifiers:
-            return self._Key.ctrl in modifiers
+        return self._modifier_contains(self._Key.ctrl)
 
     @property
     def shift_pressed(self):
@@ -572,8 +610,18 @@ class Controller:
         if self._caps_lock:
             return True
 
-        with self.modifiers as modifiers:
-            return self._Key.shift in modifiers
+        return self._modifier_contains(self._Key.shift)
+
+    def _modifier_contains(self, modifier):
+        """Determines whether a base modifier is currently pressed.
+
+        This is equivalent to testing membership in :attr:`modifiers`, but
+        does not construct the full set of modifiers.
+
+        :param Key modifier: The base modifier, such as :attr:`Key.alt`.
+        """
+        with self._modifiers_lock:
+            return any(self._as_modifier(key) == modifier for key in self._modifiers)
 
     def _resolve(self, key):
         """Resolves a key to a :class:`KeyCode` instance.
@@ -585,20 +633,24 @@ class Controller:
 
         :return: a key code, or ``None`` if it cannot be resolved
         """
+        # This is called for every key event, so look up the platform classes
+        # only once
+        Key, KeyCode = self._Key, self._KeyCode
+
         # Use the value for the key constants
-        if key in (k for k in self._Key):
+        if isinstance(key, Key):
             return key.value
 
         # Convert strings to key codes
-        if isinstance(key, six.string_types):
+        if isinstance(key, str):
             if len(key) != 1:
                 raise ValueError(key)
-            return self._KeyCode.from_char(key)
+            return KeyCode.from_char(key)
 
         # Assume this is a proper key
-        if isinstance(key, self._KeyCode):
+        if isinstance(key, KeyCode):
             if key.char is not None and self.shift_pressed:
-                return self._KeyCode(vk=key.vk, char=key.char.upper())
+                return KeyCode(vk=key.vk, char=key.char.upper())
             else:
                 return key
 
@@ -609,8 +661,10 @@ class Controller:
 
         :param key: The key being pressed or released.
         """
-        # Check whether the key is a modifier
-        if self._as_modifier(key):
+        # Check whether the key is a modifier; most keys are not, so test
+        # the mapping directly before taking the lock. Key codes for
+        # characters are never modifiers, and are skipped without hashing
+        if key.char is None and key in self._modifier_map:
             with self._modifiers_lock:
                 if is_press:
                     self._modifiers.add(key)
@@ -631,9 +685,7 @@ class Controller:
         :return: the base modifier key, or ``None`` if ``key`` is not a
             modifier
         """
-        from . import _NORMAL_MODIFIERS
-
-        return _NORMAL_MODIFIERS.get(key, None)
+        return self._modifier_map.get(key, None)
 
     def _handle(self, key, is_press):
         """The platform implementation of the actual emitting of keyboard
@@ -744,6 +796,12 @@ class Listener(AbstractListener):
             suppress=suppress,
         )
 
+        # Resolve the types used by canonical once, since it is called for
+        # every event by hotkey listeners
+        from ..keyboard import _NORMAL_MODIFIERS, Key, KeyCode
+
+        self._canonical_types = (Key, KeyCode, _NORMAL_MODIFIERS)
+
     def canonical(self, key):
         """Performs normalisation of a key.
 
@@ -760,12 +818,12 @@ class Listener(AbstractListener):
         :return: a key
         :rtype: Key or KeyCode
         """
-        from ..keyboard import _NORMAL_MODIFIERS, Key, KeyCode
+        Key, KeyCode, normal_modifiers = self._canonical_types
 
         if isinstance(key, KeyCode) and key.char is not None:
             return KeyCode.from_char(key.char.lower())
-        elif isinstance(key, Key) and key.value in _NORMAL_MODIFIERS:
-            return _NORMAL_MODIFIERS[key.value]
+        elif isinstance(key, Key) and key.value in normal_modifiers:
+            return normal_modifiers[key.value]
         elif isinstance(key, Key) and key.value.vk is not None:
             return KeyCode.from_vk(key.value.vk)
         else:
@@ -248,6 +248,20 @@ class Listener(AbstractListener):
 
             If ``self.suppress_event()`` is called, the event is suppressed
             system wide.
+
+        ``xorg_asynchronous``
+            Whether to invoke the callbacks from a separate thread. If this is
+            ``True``, a slow callback will not delay the reading of events
+            from the *X* server.
+
+            At most 1024 events are kept waiting for the callbacks; if more
+            arrive, the oldest are dropped.
+
+        ``xorg_coalesce_motion``
+            Whether to report only the last of a burst of pointer motion
+            events received at once. If this is ``True``, ``on_move`` is
+            called less often when the pointer moves fast, but intermediate
+            positions are not reported.
     """
 
     OnMoveCallbackType = Callable[[int, int, int, bool], Optional[bool]]
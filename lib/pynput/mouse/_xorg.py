@@ -30,7 +30,11 @@ try:
 except Exception as e:
     raise ImportError("failed to acquire X connection: {}".format(str(e)), e)
 
+import collections
+import contextlib
 import enum
+import threading
+import weakref
 
 import Xlib.display
 import Xlib.ext
@@ -38,14 +42,25 @@ import Xlib.ext.xtest
 import Xlib.protocol
 import Xlib.X
 
+try:
+    import xcffib
+    import xcffib.xproto
+except ImportError:
+    xcffib = None
+
+from .._util import AbstractListener
 from .._util.xorg import ListenerMixin, display_manager
 from . import _base
 
 
-class Button(enum.Enum):
-    """The various buttons."""
+class Button(enum.IntEnum):
+    """The various buttons.
 
-    unknown = None
+    The values are the *X* button numbers, so members compare equal to the
+    raw button numbers of events.
+    """
+
+    unknown = 0
     left = 1
     middle = 2
     right = 3
@@ -77,53 +92,190 @@ class Button(enum.Enum):
     button29 = 29
     button30 = 30
 
+    # Keep the string representation of a plain enum, so that a button is
+    # not formatted as its integer value
+    __str__ = enum.Enum.__str__
+
+    def __format__(self, spec):
+        return str.__format__(str(self), spec)
+
+
+#: A table of buttons indexed by event detail; the detail is a single byte,
+#: so every possible value has an entry
+_BUTTONS = tuple(
+    Button(detail) if detail <= Button.button30 else Button.unknown
+    for detail in range(256)
+)
+
+
+#: The *xcb* connection shared by all controllers and its root window, once
+#: opened; this is ``False`` if it cannot be opened
+_XCB = None
+
+#: The lock guarding opening of :attr:`_XCB`
+_XCB_LOCK = threading.Lock()
+
+
+def _xcb():
+    """Returns the shared *xcb* connection used to query the pointer
+    position.
+
+    The connection is opened when first requested, and is then shared by all
+    controllers.
+
+    :return: the tuple ``(connection, root)``, or ``None`` if *xcffib* is not
+        installed or the connection cannot be opened
+    """
+    global _XCB
+    if _XCB is None and xcffib is not None:
+        with _XCB_LOCK:
+            if _XCB is None:
+                try:
+                    connection = xcffib.connect()
+                    _XCB = (
+                        connection,
+                        connection.get_setup().roots[connection.pref_screen].root,
+                    )
+                except xcffib.ConnectionException:
+                    _XCB = False
+    return _XCB or None
+
 
 class Controller(_base.Controller):
+    __slots__ = (
+        "_display",
+        "_root",
+        "_batch",
+        "_batch_depth",
+        "_lock",
+        "_finalizer",
+    )
+
     def __init__(self, *args, **kwargs):
         super(Controller, self).__init__(*args, **kwargs)
         self._display = Xlib.display.Display()
-
-    def __del__(self):
-        if hasattr(self, "_display"):
-            self._display.close()
+        self._root = self._display.screen().root
+        self._batch = None
+        self._batch_depth = 0
+
+        # The display error handler and any batch belong to one thread at a
+        # time; this is held for the duration of a batch, so the batch state
+        # is only ever seen by the thread owning it
+        self._lock = threading.RLock()
+
+        # Close the display once this controller is collected; unlike
+        # __del__, this does not delay collection of reference cycles
+        self._finalizer = weakref.finalize(self, self._display.close)
+
+    def __enter__(self):
+        # Events sent within the block are only synchronised with the server
+        # when the outermost block exits; other threads wait until then
+        self._lock.acquire()
+        try:
+            if self._batch_depth == 0:
+                batch = display_manager(self._display)
+                batch.__enter__()
+                self._batch = batch
+            self._batch_depth += 1
+        except:
+            self._lock.release()
+            raise
+        return self
+
+    def __exit__(self, exc_type, value, traceback):
+        try:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                batch, self._batch = self._batch, None
+                batch.__exit__(exc_type, value, traceback)
+        finally:
+            self._lock.release()
 
     def _position_get(self):
-        with display_manager(self._display) as dm:
-            qp = dm.screen().root.query_pointer()
-            return (qp.root_x, qp.root_y)
+        # This request has a reply, so errors are raised directly and there
+        # is no need to synchronise the display; within a batch, events may
+        # still be queued on the Xlib connection, so we must use that one to
+        # see their effect; if xcffib is installed, we otherwise use the
+        # shared libxcb connection, which has a much cheaper request path than
+        # python-xlib
+        xcb = _xcb() if self._batch is None else None
+        if xcb is not None:
+            connection, root = xcb
+            qp = connection.core.QueryPointer(root).reply()
+        else:
+            qp = self._root.query_pointer()
+        return (qp.root_x, qp.root_y)
 
     def _position_set(self, pos):
         px, py = self._check_bounds(*pos)
-        with display_manager(self._display) as dm:
+        with self._display_manager() as dm:
             Xlib.ext.xtest.fake_input(dm, Xlib.X.MotionNotify, x=px, y=py)
 
     def _scroll(self, dx, dy):
         dx, dy = self._check_bounds(dx, dy)
-        if dy:
-            self.click(
-                button=Button.scroll_up if dy > 0 else Button.scroll_down, count=abs(dy)
-            )
+        if not dx and not dy:
+            # Avoid synchronising with the server when nothing is sent
+            return
+        clicks = (
+            (Button.scroll_up if dy > 0 else Button.scroll_down, abs(dy)),
+            (Button.scroll_right if dx > 0 else Button.scroll_left, abs(dx)),
+        )
 
-        if dx:
-            self.click(
-                button=Button.scroll_right if dx > 0 else Button.scroll_left,
-                count=abs(dx),
-            )
+        # Send all clicks before synchronising with the server once
+        with self._display_manager() as dm:
+            for button, count in clicks:
+                for _ in range(count):
+                    Xlib.ext.xtest.fake_input(dm, Xlib.X.ButtonPress, button.value)
+                    Xlib.ext.xtest.fake_input(dm, Xlib.X.ButtonRelease, button.value)
 
     def _press(self, button):
-        with display_manager(self._display) as dm:
+        with self._display_manager() as dm:
             Xlib.ext.xtest.fake_input(dm, Xlib.X.ButtonPress, button.value)
 
     def _release(self, button):
-        with display_manager(self._display) as dm:
+        with self._display_manager() as dm:
             Xlib.ext.xtest.fake_input(dm, Xlib.X.ButtonRelease, button.value)
 
+    @contextlib.contextmanager
+    def _display_manager(self):
+        """A context manager for sending events to the display.
+
+        Outside of a ``with controller:`` block this behaves like
+        :func:`~pynput._util.xorg.display_manager`; within one, events are
+        only queued, and the block synchronises the display when it exits.
+
+        If another thread is within a ``with controller:`` block, this waits
+        for that block to exit.
+        """
+        with self._lock:
+            # Since we hold the lock, any batch is owned by this thread
+            if self._batch is not None:
+                yield self._display
+            else:
+                with display_manager(self._display) as dm:
+                    yield dm
+
     def _check_bounds(self, *args):
         """Checks the arguments and makes sure they are within the bounds of a
         short integer.
 
         :param args: The values to verify.
+
+        :return: the values converted to integers
+
+        :raises ValueError: if any value is out of bounds
         """
+        # Callers usually pass two integers, and then no conversion is needed
+        if len(args) == 2:
+            x, y = args
+            if type(x) is int and type(y) is int:
+                if -0x8000 <= x <= 0x7FFF and -0x8000 <= y <= 0x7FFF:
+                    return args
+                else:
+                    raise ValueError(args)
+
+        # Compare the original values, so that values that cannot be
+        # converted are rejected before conversion
         if not all((-0x7FFF - 1) <= number <= 0x7FFF for number in args):
             raise ValueError(args)
         else:
@@ -131,40 +283,149 @@ class Controller(_base.Controller):
 
 
 class Listener(ListenerMixin, _base.Listener):
-    #: A mapping from button values to scroll directions
-    _SCROLL_BUTTONS = {
-        Button.scroll_up.value: (0, 1),
-        Button.scroll_down.value: (0, -1),
-        Button.scroll_right.value: (1, 0),
-        Button.scroll_left.value: (-1, 0),
-    }
+    __slots__ = (
+        "_wants_move",
+        "_wants_buttons",
+        "_pending",
+        "_pending_ready",
+        "_dispatching",
+        "_coalesce",
+    )
+
+    #: The buttons used for scroll events
+    _SCROLL_BUTTONS = frozenset(
+        button for button in Button if button.name.startswith("scroll_")
+    )
 
     _EVENTS = (Xlib.X.ButtonPressMask, Xlib.X.ButtonReleaseMask)
 
-    def __init__(self, *args, **kwargs):
-        super(Listener, self).__init__(*args, **kwargs)
+    #: Only the last of a burst of motion events is reported, if the
+    #: ``xorg_coalesce_motion`` option is set
+    _COALESCED_EVENTS = (Xlib.X.MotionNotify,)
+
+    _MAX_EVENTS_PER_BATCH = 64
+
+    #: The maximum number of events waiting for the dispatcher thread; when
+    #: more arrive, the oldest are dropped
+    _MAX_PENDING_EVENTS = 1024
+
+    def __init__(self, on_move=None, on_click=None, on_scroll=None, *args, **kwargs):
+        super(Listener, self).__init__(on_move, on_click, on_scroll, *args, **kwargs)
+
+        # Events for which no callback was passed need not be dispatched
+        self._wants_move = on_move is not None
+        self._wants_buttons = on_click is not None or on_scroll is not None
+
+        self._coalesce = self._options.get("coalesce_motion", False)
+
+        #: Events waiting to be dispatched from the dispatcher thread, or
+        #: ``None`` if callbacks are invoked from the event thread
+        self._pending = (
+            collections.deque(maxlen=self._MAX_PENDING_EVENTS)
+            if self._options.get("asynchronous", False)
+            else None
+        )
+
+        #: Set when events have been added to :attr:`_pending`
+        self._pending_ready = threading.Event()
+
+        #: Whether the dispatcher thread should keep running
+        self._dispatching = False
+
+    def _run(self):
+        dispatcher = None
+        if self._pending is not None:
+            self._dispatching = True
+            dispatcher = threading.Thread(target=self._dispatcher, daemon=True)
+            dispatcher.start()
+        try:
+            super(Listener, self)._run()
+        finally:
+            # Wake the dispatcher thread to let it exit, and wait for it to
+            # make sure that no callback is invoked once this listener has
+            # been joined, and that any exception is passed on to join
+            self._dispatching = False
+            self._pending_ready.set()
+            if dispatcher is not None:
+                dispatcher.join()
 
     def _handle(self, display, event):
+        # This is called for every pointer event, so read the event fields
+        # only once
+        event_type = event.type
+        if event_type in (Xlib.X.ButtonPress, Xlib.X.ButtonRelease):
+            if not self._wants_buttons:
+                return
+        elif not self._wants_move:
+            return
+
+        detail = event.detail
         px = event.root_x
         py = event.root_y
+        if self._pending is not None:
+            self._pending.append((event_type, detail, px, py))
+            self._pending_ready.set()
+        else:
+            self._dispatch(event_type, detail, px, py)
+
+    def _dispatch(self, event_type, detail, px, py):
+        """Invokes the callback for an event.
 
-        if event.type == Xlib.X.ButtonPress:
+        :param int event_type: The event type.
+
+        :param int detail: The event detail.
+
+        :param int px: The horizontal pointer position.
+
+        :param int py: The vertical pointer position.
+        """
+        if event_type == Xlib.X.ButtonPress:
             # Scroll events are sent as button presses with the scroll
-            # button codes
-            scroll = self._SCROLL_BUTTONS.get(event.detail, None)
-            if scroll:
-                self.on_scroll(px, py, *scroll)
+            # button codes; buttons compare equal to their codes
+            if detail == Button.scroll_up:
+                self.on_scroll(px, py, 0, 1)
+            elif detail == Button.scroll_down:
+                self.on_scroll(px, py, 0, -1)
+            elif detail == Button.scroll_left:
+                self.on_scroll(px, py, -1, 0)
+            elif detail == Button.scroll_right:
+                self.on_scroll(px, py, 1, 0)
             else:
-                self.on_click(px, py, self._button(event.detail), True)
+                self.on_click(px, py, _BUTTONS[detail], True)
 
-        elif event.type == Xlib.X.ButtonRelease:
+        elif event_type == Xlib.X.ButtonRelease:
             # Send an event only if this was not a scroll event
-            if event.detail not in self._SCROLL_BUTTONS:
-                self.on_click(px, py, self._button(event.detail), False)
+            if detail not in self._SCROLL_BUTTONS:
+                self.on_click(px, py, _BUTTONS[detail], False)
 
         else:
             self.on_move(px, py)
 
+    def _dispatcher(self):
+        """The runner method of the thread dispatching pending events when
+        the ``xorg_asynchronous`` option is set.
+        """
+        try:
+            while self._dispatching and self.running:
+                self._pending_ready.wait()
+                self._pending_ready.clear()
+                self._dispatch_pending()
+        except Exception:
+            # The emitter has already passed the exception on to the listener
+            pass
+
+    @AbstractListener._emitter
+    def _dispatch_pending(self):
+        """Dispatches all pending events."""
+        pending = self._pending
+        dispatch = self._dispatch
+        while self.running:
+            try:
+                event = pending.popleft()
+            except IndexError:
+                break
+            dispatch(*event)
+
     def _suppress_start(self, display):
         display.screen().root.grab_pointer(
             True,
@@ -178,17 +439,3 @@ class Listener(ListenerMixin, _base.Listener):
 
     def _suppress_stop(self, display):
         display.ungrab_pointer(Xlib.X.CurrentTime)
-
-    def _button(self, detail):
-        """Creates a mouse button from an event detail.
-
-        If the button is unknown, :attr:`Button.unknown` is returned.
-
-        :param detail: The event detail.
-
-        :return: a button
-        """
-        try:
-            return Button(detail)
-        except ValueError:
-            return Button.unknown
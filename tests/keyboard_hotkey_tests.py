@@ -55,6 +55,9 @@ class KeyboardHotKeyTest(unittest.TestCase):
         self.assertSequenceEqual(HotKey.parse("a"), [kc.from_char("a")])
         self.assertSequenceEqual(HotKey.parse("A"), [kc.from_char("a")])
         self.assertSequenceEqual(HotKey.parse("<ctrl>+a"), [k.ctrl, kc.from_char("a")])
+        self.assertSequenceEqual(HotKey.parse("+"), [kc.from_char("+")])
+        self.assertSequenceEqual(HotKey.parse("<ctrl>++"), [k.ctrl, kc.from_char("+")])
+        self.assertSequenceEqual(HotKey.parse("++<ctrl>"), [kc.from_char("+"), k.ctrl])
         self.assertSequenceEqual(
             HotKey.parse("<ctrl>+<alt>+a"), [k.ctrl, k.alt, kc.from_char("a")]
         )
@@ -123,6 +126,27 @@ class KeyboardHotKeyTest(unittest.TestCase):
         hk.press(kc.from_char("a"))
         self.assertEqual(3, len(activations))
 
+    def test_hotkeys_dispatch(self):
+        activations = []
+
+        hotkeys = GlobalHotKeys(
+            {
+                "<ctrl>+a": lambda: activations.append("a"),
+                "<ctrl>+b": lambda: activations.append("b"),
+            }
+        )
+
+        hotkeys._on_press(k.ctrl)
+        hotkeys._on_press(kc.from_char("c"))
+        self.assertEqual([], activations)
+
+        hotkeys._on_press(kc.from_char("A"))
+        self.assertEqual(["a"], activations)
+
+        hotkeys._on_release(kc.from_char("a"))
+        hotkeys._on_press(kc.from_char("b"))
+        self.assertEqual(["a", "b"], activations)
+
     def test_hotkeys(self):
         q = queue.Queue()
 
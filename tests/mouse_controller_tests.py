@@ -19,7 +19,7 @@ import numbers
 import pynput.mouse
 import time
 
-from . import EventTest
+from . import EventTest, xorg
 
 
 class MouseControllerTest(EventTest):
@@ -93,6 +93,28 @@ class MouseControllerTest(EventTest):
 
         self.controller.position = new_position
 
+    def test_button_format(self):
+        """Tests that buttons are formatted as their names"""
+        button = pynput.mouse.Button.left
+
+        self.assertEqual("Button.left", str(button))
+        self.assertEqual("Button.left", "{0}".format(button))
+        self.assertEqual("Button.left ", "{0:12}".format(button))
+
+    @xorg
+    def test_batch_errors_xorg(self):
+        """Tests that errors within a controller block are raised when the
+        block exits on Linux"""
+        from pynput._util.xorg import X11Error
+
+        sent = False
+        with self.assertRaises(X11Error):
+            with self.controller as controller:
+                # Button 0 is not a valid button
+                controller.press(pynput.mouse.Button.unknown)
+                sent = True
+        self.assertTrue(sent, "Error was raised before the block exited")
+
     def test_press(self):
         """Tests that press works"""
         for b in (pynput.mouse.Button.left, pynput.mouse.Button.right):
@@ -174,6 +174,29 @@ class MouseListenerTest(EventTest):
             )._options["test"]
         )
 
+    @xorg
+    def test_asynchronous_xorg(self):
+        """Tests that callbacks invoked from a separate thread on Linux stop
+        the listener and that exceptions are reraised"""
+
+        class MyException(Exception):
+            pass
+
+        def on_click(x, y, button, pressed):
+            raise MyException()
+
+        self.notify("Click any button")
+        self.assert_stop(
+            "No click registered",
+            on_click=lambda x, y, button, pressed: False,
+            xorg_asynchronous=True,
+        )
+
+        with self.assertRaises(MyException):
+            with pynput.mouse.Listener(on_click=on_click, xorg_asynchronous=True) as l:
+                self.notify("Click any button")
+                l.join()
+
     def test_events(self):
         """Tests that events are correctly yielded"""
         from pynput.mouse import Button, Events